@@ -21,21 +21,31 @@ from tfx.types import artifact_utils
 from ml_metadata.proto import metadata_store_pb2
 from ml_metadata.proto import metadata_store_service_pb2
 
+# Property type for each supported metadata_store_pb2.Value oneof field.
+_FIELD_VALUE_PROPERTY_TYPES = {
+    'int_value': metadata_store_pb2.INT,
+    'double_value': metadata_store_pb2.DOUBLE,
+    'string_value': metadata_store_pb2.STRING,
+}
+
 
 def build_artifact_dict(
     proto_dict: Mapping[str, metadata_store_service_pb2.ArtifactStructList]
 ) -> Dict[str, List[types.Artifact]]:
   """Converts input/output artifact dict."""
   result = {}
+  deserialize_artifact = artifact_utils.deserialize_artifact
   for k, v in proto_dict.items():
-    result[k] = []
+    artifacts = []
+    append_artifact = artifacts.append
     for artifact_struct in v.elements:
       if not artifact_struct.HasField('artifact'):
         raise RuntimeError('Only support artifact oneof field')
       artifact_and_type = artifact_struct.artifact
-      result[k].append(
-          artifact_utils.deserialize_artifact(artifact_and_type.type,
-                                              artifact_and_type.artifact))
+      append_artifact(
+          deserialize_artifact(artifact_and_type.type,
+                               artifact_and_type.artifact))
+    result[k] = artifacts
   return result
 
 
@@ -44,15 +54,16 @@ def build_artifact_struct_dict(
 ) -> Dict[str, metadata_store_service_pb2.ArtifactStructList]:
   """Converts input/output artifact dict."""
   result = {}
-  if not artifact_dict:
-    return result
+  artifact_struct_list_cls = metadata_store_service_pb2.ArtifactStructList
   for k, v in artifact_dict.items():
-    artifact_list = metadata_store_service_pb2.ArtifactStructList()
+    artifact_list = artifact_struct_list_cls()
+    add_element = artifact_list.elements.add
     for artifact in v:
-      artifact_struct = metadata_store_service_pb2.ArtifactStruct(
-          artifact=metadata_store_service_pb2.ArtifactAndType(
-              artifact=artifact.mlmd_artifact, type=artifact.artifact_type))
-      artifact_list.elements.append(artifact_struct)
+      # Fill the element in place rather than building an ArtifactStruct and
+      # ArtifactAndType only to have them copied into the repeated field.
+      artifact_and_type = add_element().artifact
+      artifact_and_type.artifact.CopyFrom(artifact.mlmd_artifact)
+      artifact_and_type.type.CopyFrom(artifact.artifact_type)
     result[k] = artifact_list
   return result
 
@@ -61,10 +72,10 @@ def build_value_dict(
     metadata_value_dict: Mapping[str, metadata_store_pb2.Value]
 ) -> Dict[str, types.Property]:
   """Converts MLMD value dict into plain value dict."""
-  result = {}
-  for k, v in metadata_value_dict.items():
-    result[k] = getattr(v, v.WhichOneof('value'))
-  return result
+  return {
+      k: getattr(v, v.WhichOneof('value'))
+      for k, v in metadata_value_dict.items()
+  }
 
 
 def build_metadata_value_dict(
@@ -72,10 +83,9 @@ def build_metadata_value_dict(
 ) -> Dict[str, metadata_store_pb2.Value]:
   """Converts plain value dict into MLMD value dict."""
   result = {}
-  if not value_dict:
-    return result
+  value_cls = metadata_store_pb2.Value
   for k, v in value_dict.items():
-    value = metadata_store_pb2.Value()
+    value = value_cls()
     if isinstance(v, str):
       value.string_value = v
     elif isinstance(v, int):
@@ -116,14 +126,10 @@ def get_metadata_value_type(
       raise RuntimeError('Expecting field_value but got %s.' % value)
 
     value_type = value.field_value.WhichOneof('value')
-    if value_type == 'int_value':
-      return metadata_store_pb2.INT
-    elif value_type == 'double_value':
-      return metadata_store_pb2.DOUBLE
-    elif value_type == 'string_value':
-      return metadata_store_pb2.STRING
-    else:
+    property_type = _FIELD_VALUE_PROPERTY_TYPES.get(value_type)
+    if property_type is None:
       raise ValueError('Unexpected value type %s' % value_type)
+    return property_type
   else:
     raise ValueError('Unexpected value type %s' % type(value))
 
@@ -144,8 +150,8 @@ def get_value(tfx_value: pipeline_pb2.Value) -> types.Property:
   if which != 'field_value':
     raise RuntimeError('Expecting field_value but got %s.' % tfx_value)
 
-  return getattr(tfx_value.field_value,
-                 tfx_value.field_value.WhichOneof('value'))
+  field_value = tfx_value.field_value
+  return getattr(field_value, field_value.WhichOneof('value'))
 
 
 def get_metadata_value(
@@ -179,8 +185,9 @@ def set_metadata_value(
   Raises:
     ValueError: If value type is not supported or is still RuntimeParameter.
   """
-  # bool is a subclass of int...
-  if isinstance(value, int) and not isinstance(value, bool):
+  # Plain ints skip the bool check; bool is a subclass of int...
+  value_type = type(value)
+  if value_type is int or (isinstance(value, int) and value_type is not bool):
     metadata_value.int_value = value
   elif isinstance(value, float):
     metadata_value.double_value = value
@@ -88,11 +88,28 @@ class DataTypesUtilsTest(tf.test.TestCase, parameterized.TestCase):
       self.assertEqual(self.artifact_dict[k][0].id, v[0].id)
       self.assertEqual(self.artifact_dict[k][0].type_name, v[0].type_name)
 
+  def testBuildArtifactDictNonArtifactElement(self):
+    artifact_struct_dict = {
+        'a1':
+            text_format.Parse(
+                """
+                elements {
+                  list {}
+                }
+                """, metadata_store_service_pb2.ArtifactStructList())
+    }
+    with self.assertRaisesRegex(RuntimeError,
+                                'Only support artifact oneof field'):
+      data_types_utils.build_artifact_dict(artifact_struct_dict)
+
   def testBuildArtifactStructDict(self):
     actual_artifact_struct_dict = data_types_utils.build_artifact_struct_dict(
         self.artifact_dict)
     self.assertEqual(self.artifact_struct_dict, actual_artifact_struct_dict)
 
+  def testBuildArtifactStructDictEmpty(self):
+    self.assertEqual({}, data_types_utils.build_artifact_struct_dict({}))
+
   def testBuildValueDict(self):
     actual_value_dict = data_types_utils.build_value_dict(
         self.metadata_value_dict)
@@ -103,6 +120,9 @@ class DataTypesUtilsTest(tf.test.TestCase, parameterized.TestCase):
         data_types_utils.build_metadata_value_dict(self.value_dict))
     self.assertEqual(self.metadata_value_dict, actual_metadata_value_dict)
 
+  def testBuildMetadataValueDictEmpty(self):
+    self.assertEqual({}, data_types_utils.build_metadata_value_dict({}))
+
   def testGetMetadataValueType(self):
     tfx_value = pipeline_pb2.Value()
     text_format.Parse(
@@ -114,10 +134,34 @@ class DataTypesUtilsTest(tf.test.TestCase, parameterized.TestCase):
         data_types_utils.get_metadata_value_type(tfx_value),
         metadata_store_pb2.INT)
 
+  @parameterized.named_parameters(
+      ('DoubleValue', 'double_value: 1.0', metadata_store_pb2.DOUBLE),
+      ('StringValue', 'string_value: "1"', metadata_store_pb2.STRING))
+  def testGetMetadataValueTypeOtherFieldValues(self, field_value,
+                                               expected_type):
+    tfx_value = pipeline_pb2.Value()
+    text_format.Parse('field_value { %s }' % field_value, tfx_value)
+    self.assertEqual(
+        data_types_utils.get_metadata_value_type(tfx_value), expected_type)
+
+  def testGetMetadataValueTypeUnsetFieldValue(self):
+    tfx_value = pipeline_pb2.Value()
+    tfx_value.field_value.SetInParent()
+    with self.assertRaisesRegex(ValueError, 'Unexpected value type None'):
+      data_types_utils.get_metadata_value_type(tfx_value)
+
   def testGetMetadataValueTypePrimitiveValue(self):
     self.assertEqual(
         data_types_utils.get_metadata_value_type(1), metadata_store_pb2.INT)
 
+  @parameterized.named_parameters(
+      ('FloatValue', 1.0, metadata_store_pb2.DOUBLE),
+      ('StrValue', '1', metadata_store_pb2.STRING),
+      ('BoolValue', True, metadata_store_pb2.INT))
+  def testGetMetadataValueTypeOtherPrimitiveValues(self, value, expected_type):
+    self.assertEqual(
+        data_types_utils.get_metadata_value_type(value), expected_type)
+
   def testGetMetadataValueTypeFailed(self):
     tfx_value = pipeline_pb2.Value()
     text_format.Parse(
@@ -180,6 +224,15 @@ class DataTypesUtilsTest(tf.test.TestCase, parameterized.TestCase):
     data_types_utils.set_metadata_value(pb, value)
     self.assertEqual(pb, expected_pb)
 
+  def testSetMetadataValueWithPrimitiveSubclassValue(self):
+
+    class _Str(str):
+      pass
+
+    pb = metadata_store_pb2.Value()
+    data_types_utils.set_metadata_value(pb, _Str('42'))
+    self.assertEqual(pb, metadata_store_pb2.Value(string_value='42'))
+
   def testSetMetadataValueUnsupportedType(self):
     pb = metadata_store_pb2.Value()
     with self.assertRaises(ValueError):